@@ -6,6 +6,7 @@ __version__ = "0.1"
 from dolfin import *
 from ASP.solverbase import SolverBase as Solver
 from ASP.problembase import ProblemBase as Problem
+from ASP.stepevents import StepEvents
 
 # Default options
 OPTIONS = {
@@ -21,6 +22,7 @@ OPTIONS = {
     'refinement_algorithm': 'regular_cut',  # algorithm to use in refinement
     'adapt_ratio': 0.1,  # percent of mesh to refine
     'max_adaptations': 30,  # max number of times to adapt mesh
+    'time_slabs': 1,  # number of time slabs with their own adapted mesh
     'adaptive_TOL': 1E-20,  # tolerance for terminating adaptivity
     'optimize': False,  # optimize as defined in solver
     'on_disk': 0.,  # percent of steps on disk
@@ -30,8 +32,12 @@ OPTIONS = {
     'plot_solution': True,
     'debug': False,
     'check_mem_usage': False,
+    'mem_usage_interval': 1.,  # seconds between memory usage checks
+    'progress_interval': 0.1,  # seconds between progress updates, None for none
     'absolute_tolerance': 1e-25,
     'relative_tolerance': 1e-12,
     'monitor_convergence': False,
     'initial_mesh': None,  # to use for initial computation
+    'mesh_cache': None,  # location to cache generated meshes
+    'restart_adaptation': None,  # adapted mesh to restart adaptivity from
 }
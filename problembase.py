@@ -16,6 +16,9 @@ except:
         + 'Adjointing will not be available.')
     adjointer = False
 
+from hashlib import md5
+import os
+
 
 class ProblemBase:  # Base class for all problems.
 
@@ -41,6 +44,89 @@ class ProblemBase:  # Base class for all problems.
         self.solver = None
         self.output_location = ''
 
+        # location of cached generated meshes
+        if 'mesh_cache' in options.keys():
+            self.mesh_cache = options['mesh_cache']
+        else:
+            self.mesh_cache = None
+
+    def load_mesh(self, filename, name='/mesh'):
+        '''
+            Load a mesh from file. HDF5 files are read from the dataset name,
+            any other format is handed directly to DOLFIN.
+        '''
+        if filename.endswith('.h5'):
+            mesh = Mesh()
+            hdf = HDF5File(mesh.mpi_comm(), filename, 'r')
+            hdf.read(mesh, name, False)
+            hdf.close()
+        else:
+            mesh = Mesh(filename)
+
+        return mesh
+
+    def cached_mesh(self, generator, *args, **kwargs):
+        '''
+            Generate a mesh, e.g. self.cached_mesh(UnitSquareMesh, Nx, Ny). If
+            mesh_cache is set the mesh is stored there as HDF5, keyed by the
+            generator, its arguments and the number of processes, so later
+            runs load it instead.
+        '''
+        if self.mesh_cache is None:
+            return generator(*args, **kwargs)
+
+        comm = mpi_comm_world()
+        # the communicator is covered by the number of processes
+        values = [self.cache_value(a) for a in args
+                  if not isinstance(a, type(comm))] \
+            + ['{}={}'.format(key, self.cache_value(kwargs[key]))
+               for key in sorted(kwargs)
+               if not isinstance(kwargs[key], type(comm))] \
+            + ['np={:d}'.format(MPI.size(comm))]
+        key = md5(','.join(values).encode()).hexdigest()[:12]
+        filename = os.path.join(self.mesh_cache,
+                                '{}_{}.h5'.format(generator.__name__, key))
+
+        # rank 0 decides so that all processes take the same branch
+        rank0 = MPI.rank(comm) == 0
+        cached = rank0 and os.path.isfile(filename)
+        if MPI.max(comm, float(cached)) > 0:
+            return self.load_mesh(filename)
+
+        mesh = generator(*args, **kwargs)
+        # write to a temporary file first so that concurrent runs never
+        # read a partially written mesh, named after the pid of rank 0
+        if rank0:
+            try:
+                os.makedirs(self.mesh_cache)
+            except OSError:  # already exists
+                pass
+        pid = int(MPI.max(comm, float(os.getpid() if rank0 else 0)))
+        tmp = '{}.{:d}'.format(filename, pid)
+        hdf = HDF5File(comm, tmp, 'w')
+        hdf.write(mesh, '/mesh')
+        hdf.close()
+        if rank0:
+            os.rename(tmp, filename)
+        MPI.barrier(comm)
+
+        return mesh
+
+    def cache_value(self, value):
+        '''
+            String of a mesh generator argument for the cache key. Points are
+            given by their coordinates, other DOLFIN objects are rejected since
+            their repr includes an address and would never hit the cache.
+        '''
+        if isinstance(value, Point):
+            return 'Point({!r},{!r},{!r})'.format(value.x(), value.y(),
+                                                  value.z())
+        if not isinstance(value, (bool, int, float, str)):
+            raise TypeError('Can not cache a mesh generated from {!r}.'
+                            .format(value))
+
+        return repr(value)
+
     def initial_conditions(self, W, t):
         pass
 
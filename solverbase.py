@@ -10,7 +10,7 @@ from dolfin import *
 try:
     from dolfin_adjoint import *
 
-    parameters['adjoint"]["record_all'] = True
+    parameters['adjoint']['record_all'] = True
     adjointer = True
 except:
     print('WARNING: Could not import DOLFIN-Adjoint. ' \
@@ -18,10 +18,12 @@ except:
     adjointer = False
 
 from time import time
-from os import getpid
+from os import getpid, path
 from subprocess import getoutput
 import sys
 
+from ASP.stepevents import StepEvents
+
 # Common solver parameters
 maxiter = default_maxiter = 200
 tolerance = default_tolerance = 1e-4
@@ -48,12 +50,17 @@ class SolverBase:
         # Reset files for storing solution
         self._ufile, self._pfile = None, None
         self._uDualfile, self._pDualfile, self.eifile = None, None, None
-        self.meshfile = None
+        self.meshfile, self._meshname = None, None
         self.optfile = None
 
         # Reset storage for functional values and errors
         # Reset some solver variables
         self._t, self._time, self._cputime, self._timestep = [], None, 0.0, 0
+        self._steptime = 0.0
+
+        # subscribers to the time steps
+        self.events = StepEvents(copy=self.copy_event)
+        self.subscribe_events()
 
     def set_parameters(self, options):
 
@@ -76,6 +83,14 @@ class SolverBase:
     def set_options(self, options):
 
         self.mem = options['check_mem_usage']
+        if 'mem_usage_interval' in options.keys():
+            self.memInterval = options['mem_usage_interval']
+        else:
+            self.memInterval = 1.
+        if 'progress_interval' in options.keys():
+            self.progressInterval = options['progress_interval']
+        else:
+            self.progressInterval = 0.1
 
         self.saveSolution = options['save_solution']
         self.saveFrequency = options['save_frequency']
@@ -92,6 +107,14 @@ class SolverBase:
         self.maxAdapts = options['max_adaptations']
         self.adaptTOL = options['adaptive_TOL']
         self.onDisk = options['on_disk']
+        if 'time_slabs' in options.keys():
+            self.timeSlabs = options['time_slabs']
+        else:
+            self.timeSlabs = 1
+        if 'restart_adaptation' in options.keys():
+            self.restart = options['restart_adaptation']
+        else:
+            self.restart = None
 
         self.dir = options['folder']  # path to save data
 
@@ -119,7 +142,9 @@ class SolverBase:
             T, t0, k = None, None, None
 
         if self.adaptive:  # solve with adaptivity
-            if adjointer:
+            if adjointer and self.timeSlabs > 1 and not self.steady_state:
+                mesh, k = self.slab_adaptivity(problem, mesh, T, t0, k)
+            elif adjointer:
                 mesh, k = self.adaptivity(problem, mesh, T, t0, k)
             else:
                 print('WARNING: You have requested adaptivity, but DOLFIN-Adjoint' \
@@ -133,20 +158,33 @@ class SolverBase:
         if adjointer:
             annotate = self.adaptive or (self.optimize and
                                          'Optimize' in dir(problem))
-            parameters['adjoint"]["stop_annotating'] = not annotate
+            parameters['adjoint']['stop_annotating'] = not annotate
         else:
             annotate = False
 
         func = 'functional' in dir(problem)
-        W, w, m = self.forward_solve(problem, mesh, t0, T, k,
-                                     func=func, annotate=annotate)
+        self.reset_timestep()
+        if isinstance(mesh, list):  # one mesh per time slab
+            # the transfers between slabs are not annotated, see slab_solve
+            if adjointer:
+                parameters['adjoint']['stop_annotating'] = True
+            W, w, m = self.slab_forward_solve(problem, mesh, t0, T, k,
+                                              func=func)
+            W, w = W[-1], w[-1]
+        else:
+            W, w, m = self.forward_solve(problem, mesh, t0, T, k,
+                                         func=func, annotate=annotate)
 
         if m is not None:
             print('The size of the functional is: {:0.3G}'.format(m))
 
         # solve the optimization problem
         if(self.optimize and 'Optimize' in dir(problem)):
-            if adjointer:
+            if isinstance(mesh, list):
+                print('WARNING: You have requested Optimization, but' \
+                    + ' it is not available with time slabs.')
+                print('Not running optimization.')
+            elif adjointer:
                 # give me an end line so that dolfin-adjoint doesn't
                 # cover previous prints
                 print()
@@ -154,7 +192,8 @@ class SolverBase:
 
                 self.file_naming(problem, n=-1, opt=True)
 
-                parameters['adjoint"]["stop_annotating'] = True
+                parameters['adjoint']['stop_annotating'] = True
+                self.reset_timestep()
                 W, w, m = self.forward_solve(problem, mesh, t0, T, k, func=func)
             else:
                 print('WARNING: You have requested Optimization, but' \
@@ -168,12 +207,22 @@ class SolverBase:
 
         # Adaptive loop
         i, m = 0, 0  # initialize
+        if self.restart is not None:  # continue from a saved adapted mesh
+            i = self.restart
+            self.file_naming(problem, n=i, opt=False)
+            mesh = problem.load_mesh(self.meshfile, self._meshname)
+            self.truncate_meshes(problem, ['/mesh{:02d}'.format(n)
+                                           for n in range(i + 1)])
+            if 'time_step' in dir(problem) and not self.steady_state:
+                k = self.adjust_dt(t0, T, problem.time_step(problem.Ubar, mesh))
+            print('Restarting from {} mesh.'.format(self.which_mesh(i)))
+
         while(i <= self.maxAdapts and COND > self.adaptTOL):
             # setup file names
             self.file_naming(problem, n=i, opt=False)
-            # save our current mesh
-            if self.saveSolution:
-                self.meshfile << mesh
+            # save our current mesh so that we can restart from it
+            if i != self.restart:
+                self.save_mesh(mesh, append=(i > 0))
 
             print('Solving on {} mesh.'.format(self.which_mesh(i)))
 
@@ -208,7 +257,7 @@ class SolverBase:
             adaptivity. This is all done automatically using the weak_residual.
         '''
         print('Solving the primal problem.')
-        parameters['adjoint"]["stop_annotating'] = False
+        parameters['adjoint']['stop_annotating'] = False
 
         if not self.steady_state:
             N = int(round((T - t0) / k))
@@ -220,10 +269,10 @@ class SolverBase:
                                   snaps_in_ram=int((1. - self.onDisk) * N),
                                   verbose=False)
 
-        self._timestep = 0  # reset the time step to zero
+        self.reset_timestep()
         W, w, m = self.forward_solve(problem, mesh, t0, T, k, func=True)
-        parameters['adjoint"]["stop_annotating'] = True
-        self._timestep = 0  # reset the time step to zero
+        parameters['adjoint']['stop_annotating'] = True
+        self.reset_timestep()
 
         print('Solving the dual problem.')
         # Generate the dual problem
@@ -239,6 +288,204 @@ class SolverBase:
 
         return W, w, m, ei
 
+    def slab_adaptivity(self, problem, mesh, T, t0, k):
+        '''
+            Adaptivity on space-time slabs. The time interval is split into
+            time_slabs slabs, each with its own mesh which is refined using
+            only the error indicators accumulated over that slab.
+        '''
+        COND = 1
+        meshes = [mesh] * self.timeSlabs
+
+        # Adaptive loop
+        i, m = 0, 0  # initialize
+        if self.restart is not None:  # continue from saved adapted meshes
+            i = self.restart
+            self.file_naming(problem, n=i, opt=False)
+            meshes = [problem.load_mesh(self.meshfile,
+                                        self._meshname + '_slab{:02d}'.format(s))
+                      for s in range(self.timeSlabs)]
+            self.truncate_meshes(problem, ['/mesh{:02d}_slab{:02d}'.format(n, s)
+                                           for n in range(i + 1)
+                                           for s in range(self.timeSlabs)])
+            if 'time_step' in dir(problem):
+                k = self.adjust_dt(t0, T, min(problem.time_step(problem.Ubar, mesh)
+                                              for mesh in meshes))
+            print('Restarting from {} meshes.'.format(self.which_mesh(i)))
+
+        while(i <= self.maxAdapts and COND > self.adaptTOL):
+            # setup file names
+            self.file_naming(problem, n=i, opt=False)
+            # save our current meshes so that we can restart from them
+            for s, mesh in enumerate(meshes):
+                if i != self.restart:
+                    self.save_mesh(mesh, append=(i > 0 or s > 0),
+                                   name=self._meshname + '_slab{:02d}'.format(s))
+
+            print('Solving on {} meshes ({:d} time slabs).'.format(
+                self.which_mesh(i), len(meshes)))
+
+            # Solve primal and dual problems and compute error indicators
+            m_ = m  # save the previous functional value
+            m, ei = self.slab_solve(problem, meshes, t0, T, k)
+            COND = self.condition(ei, m, m_)
+            print('DOFs={:d} functional={:0.5G} err_est={:0.5G}'.format(
+                sum(mesh.num_vertices() for mesh in meshes), m, COND))
+
+            if self.saveSolution:  # Save solution
+                for e in ei:
+                    self.eifile << e
+
+            # Refine the meshes, each with its own error indicators
+            print('Refining meshes.')
+            meshes = [self.adaptive_refine(mesh, e)
+                      for mesh, e in zip(meshes, ei)]
+            if 'time_step' in dir(problem):
+                k = self.adjust_dt(t0, T, min(problem.time_step(problem.Ubar, mesh)
+                                              for mesh in meshes))
+
+            adj_reset()  # reset the dolfin-adjoint
+
+            i += 1
+
+        if i > self.maxAdapts and COND > self.adaptTOL:
+            print('Warning reached max adaptive iterations with' \
+                + 'sum(abs(EI))={:0.3G}. Solution may not be accurate.'.format(COND))
+
+        return meshes, k
+
+    def time_slabs(self, t0, T, k):
+        '''
+            Returns the end points of the time_slabs slabs of [t0, T]. These
+            are t0 + s * (T - t0) / time_slabs snapped to the time steps so the
+            number of slabs does not depend on k.
+        '''
+        N = int(round((T - t0) / k))
+        assert N >= self.timeSlabs, 'Fewer time steps than time slabs.'
+        n = [int(round(s * N / float(self.timeSlabs)))
+             for s in range(self.timeSlabs)]
+
+        return [t0 + n_s * k for n_s in n] + [T]
+
+    def slab_solve(self, problem, meshes, t0, T, k):
+        '''
+            The time slab version of adaptive_solve. The primal problem is
+            solved across all slabs, keeping the solution at the end of each
+            slab. The dual problem is then solved slab by slab backwards in
+            time: each slab is recomputed with annotation from the previous
+            slab's solution, and the dual of its initial condition is passed
+            on to the previous slab through slab_transfer_adjoint. Returns the
+            functional and a list with the error indicators of each slab.
+        '''
+        print('Solving the primal problem.')
+        parameters['adjoint']['stop_annotating'] = True
+        self.reset_timestep()
+        W, w, m = self.slab_forward_solve(problem, meshes, t0, T, k, func=True)
+        times = self.time_slabs(t0, T, k)
+
+        print('Solving the dual problem.')
+        self.reset_timestep()
+        ei, g = [None] * len(meshes), None
+        for s in reversed(range(len(meshes))):
+            adj_reset()
+            parameters['adjoint']['stop_annotating'] = False
+
+            N = int(round((times[s + 1] - times[s]) / k))
+            assert self.onDisk <= 1. or self.onDisk >= 0.
+            if self.onDisk > 0:
+                adj_checkpointing(strategy='multistage', steps=N,
+                                  snaps_on_disk=int(self.onDisk * N),
+                                  snaps_in_ram=int((1. - self.onDisk) * N),
+                                  verbose=False)
+
+            if g is not None:  # record the end condition of this slab's dual
+                g = Function(g, name='slab_dual', annotate=True)
+
+            # recompute the slab on the tape, silently as it was reported
+            # during the primal solve
+            w0 = w[s - 1] if s > 0 else None
+            with self.events.muted():
+                W_s, w_s, _ = self.forward_solve(problem, meshes[s], times[s],
+                                                 times[s + 1], k,
+                                                 annotate=True, w0=w0)
+            parameters['adjoint']['stop_annotating'] = True
+
+            functional = problem.functional(W_s, w_s) * dt
+            if g is not None:
+                functional += inner(g, w_s) * dx * dt[FINISH_TIME]
+            J = Functional(functional, name='DualArgument')
+            phi, wtape, phi0 = self.dual_sweep(problem, J, W_s, k, w_s,
+                                               times[s + 1])
+
+            # the first step of the slab starts from the transferred solution
+            # of the previous slab
+            if w0 is not None:
+                wtape.append(self.slab_transfer(w0, W_s))
+            ei[s] = self.build_error_indicators(problem, W_s, k, phi, wtape)
+
+            if w0 is not None:
+                g = self.slab_transfer_adjoint(W[s - 1], W_s, phi0)
+        print()
+
+        return m, ei
+
+    def slab_forward_solve(self, problem, meshes, t0, T, k, func=False):
+        '''
+            Solve the primal problem slab by slab, each slab on its own mesh.
+            The solution at the end of a slab is transferred to the mesh of
+            the next slab as its initial condition. Returns lists of the
+            function spaces and solutions of each slab.
+        '''
+        times = self.time_slabs(t0, T, k)
+
+        Ws, ws, m, w = [], [], 0., None
+        for s, mesh in enumerate(meshes):
+            W, w, m_s = self.forward_solve(problem, mesh, times[s],
+                                           times[s + 1], k, func=func, w0=w)
+            Ws.append(W)
+            ws.append(w)
+            if func:
+                m += m_s
+
+        return Ws, ws, (m if func else None)
+
+    def slab_transfer(self, w, W):
+        '''
+            Transfer w onto W, e.g. from one time slab's mesh to the next, by
+            L2 projection. The projection is not annotated since dolfin-adjoint
+            can not assemble its adjoint across meshes, slab_solve applies
+            slab_transfer_adjoint instead.
+        '''
+        if adjointer:
+            w0 = project(w, W, annotate=False)
+        else:
+            w0 = project(w, W)
+        w0.rename('w0', 'w0')
+
+        return w0
+
+    def slab_transfer_adjoint(self, W, W_next, phi0):
+        '''
+            Apply the transpose of slab_transfer from W to W_next to phi0, the
+            dual of the initial condition on W_next. Returns g on W such that
+            inner(g, w) * dx at the end of the slab on W passes phi0 on to its
+            dual problem.
+        '''
+        # the projection is M_next^-1 B so its transpose is B^T M_next^-1
+        y = Function(W_next)
+        M = assemble(inner(TrialFunction(W_next), TestFunction(W_next)) * dx,
+                     annotate=False)
+        solve(M, y.vector(), phi0.vector(), annotate=False)
+        b = assemble(inner(y, TestFunction(W)) * dx, annotate=False)
+
+        # and the derivative of inner(g, w) * dx is M g
+        g = Function(W)
+        M = assemble(inner(TrialFunction(W), TestFunction(W)) * dx,
+                     annotate=False)
+        solve(M, g.vector(), b, annotate=False)
+
+        return g
+
     def compute_dual(self, problem, W, k, w):
 
         if self.steady_state:
@@ -246,12 +493,22 @@ class SolverBase:
         else:
             functional = problem.functional(W, w) * dt
         J = Functional(functional, name='DualArgument')
-        timestep, wtape, phi = None, [], []
 
-        self._timestep = 0  # reset the time step to zero
+        self.reset_timestep()
+
+        phi, wtape, _ = self.dual_sweep(problem, J, W, k, w, problem.T)
+
+        return phi, wtape
+
+    def dual_sweep(self, problem, J, W, k, w, t):
+        '''
+            Solve the dual problem of J backwards in time from t. Returns the
+            dual solutions and the tape values of w, and the dual of the
+            initial condition w0 of a time slab, None if there is none.
+        '''
+        timestep, wtape, phi, phi0 = None, [], [], None
 
         # compute the dual solution used in ei and grab the tape value
-        t = problem.T
         iteration = 0
         for (adj, var) in compute_adjoint(J, forget=False):
             if var.name == 'w':
@@ -270,8 +527,12 @@ class SolverBase:
                 if not self.steady_state:
                     self.update(problem, t, W, phi[-1], dual=True)
                     t -= k
+            elif var.name == 'w0':
+                phi0 = adj
 
-        return phi, wtape
+        self.events.flush()
+
+        return phi, wtape, phi0
 
     def build_error_indicators(self, problem, W, k, phi, wtape):
         Z = FunctionSpace(W.mesh(), 'DG', 0)
@@ -302,23 +563,32 @@ class SolverBase:
             ei - error indicators (non-Galerkin-orthogonal problems)
             m - current functional size (Galerkin-orthogonal problems)
             m_ - previous functional size (Galerkin-orthogonal problems)
+            With time slabs ei is a list of the error indicators of each slab.
         '''
-        c = abs(sum(ei.vector()))
+        if isinstance(ei, list):
+            c = abs(sum(sum(e.vector()) for e in ei))
+        else:
+            c = abs(sum(ei.vector()))
 
         return c
 
     def forward_solve(self, problem, mesh, t0, T, k,
-                      func=False, annotate=False):
+                      func=False, annotate=False, w0=None):
         '''
             Here we take the weak_residual and apply boundary conditions and
-            then send it to time_stepper for solving.
+            then send it to time_stepper for solving. If w0 is given it is
+            used as initial condition instead of the problem's, e.g. the
+            solution of the previous time slab.
         '''
 
         # Define function spaces
         # we do it this way so that it can be overloaded
         W = self.function_space(mesh)
 
-        if not self.steady_state:
+        if not self.steady_state and w0 is not None:
+            # transfer the previous solution to this mesh
+            ic = self.slab_transfer(w0, W)
+        elif not self.steady_state:
             ic = problem.initial_conditions(W, annotate=annotate)
 
         # define trial and test function
@@ -423,6 +693,7 @@ class SolverBase:
             m = None
 
         self.update(problem, None, W, w)
+        self.events.flush()
 
         return w, m
 
@@ -435,12 +706,18 @@ class SolverBase:
         if adjointer:
             adj_start_timestep(t)
 
+        # a later time slab continues where the previous one stopped
+        first = t < problem.t0 + k / 2.
+
         bcs = problem.boundary_conditions(W, t)
 
         # save initial condition
-        self.update(problem, t, W, w_)
+        if first:
+            self.update(problem, t, W, w_)
 
-        if func and adjointer:  # annotation only works with DOLFIN-Adjoint
+        if func and not first:
+            m = 0.
+        elif func and adjointer:  # annotation only works with DOLFIN-Adjoint
             m = k * assemble(problem.functional(W, w_), annotate=False)
         elif func:
             m = k * assemble(problem.functional(W, w_))
@@ -472,6 +749,7 @@ class SolverBase:
 
             self.update(problem, t, W, w_)
 
+        self.events.flush()
         print()
 
         return w, m
@@ -482,64 +760,104 @@ class SolverBase:
     def post_step(self, problem, t, k, W, w, w_):
         pass
 
+    def subscribe_events(self):
+        '''
+            Subscribe the default step events: saving, memory usage and
+            progress. Overload this, or use self.events.subscribe, to change
+            what is done at each time step.
+        '''
+        if self.saveSolution and self.saveFrequency != 0:  # Save solution
+            self.events.subscribe(self.save_event, steps=self.saveFrequency)
+
+        if self.mem:  # Check memory usage
+            self.events.subscribe(self.memory_event, seconds=self.memInterval)
+
+        if self.progressInterval is not None:  # Print progress
+            self.events.subscribe(self.progress_event,
+                                  seconds=self.progressInterval)
+
     def update(self, problem, t, W, w, dual=False):
         '''
-            Saves the data at each time step.
+            Records the time step and notifies the subscribers in
+            self.events.
         '''
         # Add to accumulated CPU time
-        timestep_cputime = time() - self._time
-        self._cputime += timestep_cputime
+        self._steptime = time() - self._time
+        self._cputime += self._steptime
 
         if not dual or t is not None:  # Store time steps
             self._t.append(t)
 
-        if self.saveSolution:  # Save solution
-            self.Save(problem, w, dual=dual)
+        if self.events:
+            self.events.notify(self, problem, t, W, w, dual=dual)
 
-        # Check memory usage
-        if self.mem:
-            print('Memory usage is:', self.getMyMemoryUsage())
+        if t is not None:
+            # Increase time step
+            self._timestep += 1
+
+        # record current time
+        self._time = time()
+
+    def copy_event(self, w):
+        '''
+            Copy of w for the threaded subscribers which is kept off the
+            dolfin-adjoint tape.
+        '''
+        if adjointer:
+            return Function(w, annotate=False)
+
+        return w.copy(deepcopy=True)
+
+    def reset_timestep(self):
+        '''
+            Start counting time steps anew, e.g. at the start of a primal or
+            dual solve, so that the step limited subscribers fire first.
+        '''
+        self._timestep = 0
+        self.events.reset()
+
+    def save_event(self, solver, problem, t, W, w, dual):
+        # writes to the current files, so this must not be threaded
+
+        self.Save(problem, w, dual=dual)
+
+    def memory_event(self, solver, problem, t, W, w, dual):
+
+        print('Memory usage is:', self.getMyMemoryUsage())
+
+    def progress_event(self, solver, problem, t, W, w, dual):
 
         # Print progress
         if t is not None:
             s = 'Time step {:d} finished in {:g} seconds, '.format(self._timestep,
-                                                                   timestep_cputime)
+                                                                   self._steptime)
             perc = 100 * t / problem.T
             if dual:
                 perc = 100 - perc
                 s += '{:g}%% done (t = {:g}, T = {:g}).'.format(perc, round(t, 14),
                                                                 problem.T)
 
-        if t is not None:
             sys.stdout.write('\033[K')
             sys.stdout.write(s + '\r')
             sys.stdout.flush()
 
-            # Increase time step
-            self._timestep += 1
-
-        # record current time
-        self._time = time()
-
     def Save(self, problem, w, dual=False):
         '''
             Save a variables associated with a time step. Here we assume there
             are two variables where the first variable is vector-valued and the
             second variable is a scalar. If this doesn't fit the particular
             solvers variables the user will need to overload this function.
+            How often it is called is set by save_frequency, see
+            subscribe_events.
         '''
-        u = w.split()[0]
-        p = w.split()[1]
+        u, p = w.split()[:2]
 
-        if self.saveFrequency != 0 \
-                and ((self._timestep - 1) % self.saveFrequency == 0
-                     or self._timestep == 0 or self._timestep == problem.T):
-            if not dual:
-                self._ufile << u
-                self._pfile << p
-            else:
-                self._uDualfile << u
-                self._pDualfile << p
+        if not dual:
+            self._ufile << u
+            self._pfile << p
+        else:
+            self._uDualfile << u
+            self._pDualfile << p
 
     def prefix(self, problem):
         '''
@@ -592,7 +910,7 @@ class SolverBase:
                 self._pfile = File(s + '_p.pvd', 'compressed')
             self._uDualfile = File(s + '_uDual.pvd', 'compressed')
             self._pDualfile = File(s + '_pDual.pvd', 'compressed')
-            self.meshfile = File(s + '_mesh.xml')
+            self.meshfile, self._meshname = s + '_mesh.h5', '/mesh'
         else:  # adaptive specific files
             if self.eifile is None:  # error indicators
                 self.eifile = File(s + '_ei.pvd', 'compressed')
@@ -600,7 +918,35 @@ class SolverBase:
             self._pfile = File(s + '_p{:02d}.pvd'.format(n), 'compressed')
             self._uDualfile = File(s + '_uDual{:02d}.pvd'.format(n), 'compressed')
             self._pDualfile = File(s + '_pDual{:02d}.pvd'.format(n), 'compressed')
-            self.meshfile = File(s + '_mesh{:02d}.xml'.format(n))
+            # all adapted meshes are stored in a single file
+            self.meshfile = s + '_meshes.h5'
+            self._meshname = '/mesh{:02d}'.format(n)
+
+    def save_mesh(self, mesh, append=False, name=None):
+        '''
+            Write mesh in HDF5 format to the file and dataset set up by
+            file_naming, unless another dataset name is given. If append is
+            False the file is started anew.
+        '''
+        if name is None:
+            name = self._meshname
+        if append and path.isfile(self.meshfile):
+            mode = 'a'
+        else:
+            mode = 'w'
+        hdf = HDF5File(mesh.mpi_comm(), self.meshfile, mode)
+        hdf.write(mesh, name)
+        hdf.close()
+
+    def truncate_meshes(self, problem, names):
+        '''
+            Rewrite the mesh file with only the datasets in names, i.e. the
+            meshes up to the one adaptivity restarts from, so that the meshes
+            refined after the restart replace those of the earlier run.
+        '''
+        meshes = [problem.load_mesh(self.meshfile, name) for name in names]
+        for j, (mesh, name) in enumerate(zip(meshes, names)):
+            self.save_mesh(mesh, append=(j > 0), name=name)
 
     def getMyMemoryUsage(self):
         '''
@@ -0,0 +1,165 @@
+__author__ = 'Erich L Foster <erichlf@gmail.com>'
+__date__ = '2026-10-18'
+__license__ = 'GNU GPL version 3 or any later version'
+
+from time import time
+from contextlib import contextmanager
+from threading import Thread
+from queue import Queue
+
+
+class Subscriber:
+
+    '''
+        A callback on the step events of a solver, called as
+        callback(solver, problem, t, W, w, dual). It is called at most every
+        steps events and at most once per seconds of wall time. If dual is
+        False it is not called during the dual sweep and if threaded is True
+        it is run on a worker thread with a copy of w. A threaded callback
+        runs after the solver has moved on, so it must only use its
+        arguments and not the state of the solver, e.g. the current time
+        step or output files. DOLFIN I/O subscribers must not be threaded.
+    '''
+
+    def __init__(self, callback, steps=1, seconds=0., dual=True,
+                 threaded=False):
+
+        self.callback = callback
+        self.steps = steps
+        self.seconds = seconds
+        self.dual = dual
+        self.threaded = threaded
+
+        # event count and wall time of the last call
+        self._step, self._time = None, None
+
+    def due(self, step, now):
+        '''
+            Determines if the callback should be called for this event.
+        '''
+        if self._step is not None \
+                and (step - self._step < self.steps
+                     or now - self._time < self.seconds):
+            return False
+
+        self._step, self._time = step, now
+
+        return True
+
+    def reset(self):
+
+        self._step, self._time = None, None
+
+
+class StepEvents:
+
+    '''
+        StepEvents passes the time steps of a solver on to its subscribers.
+        An empty StepEvents is False so that the solver can skip it. copy
+        makes the copies of w handed to the threaded subscribers.
+    '''
+
+    def __init__(self, copy=None):
+
+        self.subscribers = []
+        if copy is None:
+            self.copy = lambda w: w.copy(deepcopy=True)
+        else:
+            self.copy = copy
+        self._count = 0
+
+        # worker thread for the threaded subscribers, started when needed
+        self._queue, self._error = None, None
+
+    def __bool__(self):
+
+        return len(self.subscribers) > 0
+
+    def subscribe(self, callback, steps=1, seconds=0., dual=True,
+                  threaded=False):
+        '''
+            Register callback, see Subscriber for the arguments. Returns the
+            Subscriber so that it can be unsubscribed.
+        '''
+        subscriber = Subscriber(callback, steps=steps, seconds=seconds,
+                                dual=dual, threaded=threaded)
+        self.subscribers.append(subscriber)
+
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+
+        self.subscribers.remove(subscriber)
+
+    def reset(self):
+        '''
+            Start counting events anew, the next event is due for all
+            subscribers.
+        '''
+        self._count = 0
+        for subscriber in self.subscribers:
+            subscriber.reset()
+
+    @contextmanager
+    def muted(self):
+        '''
+            Suspend all subscribers within a with block.
+        '''
+        subscribers, self.subscribers = self.subscribers, []
+        try:
+            yield
+        finally:
+            self.subscribers = subscribers
+
+    def notify(self, solver, problem, t, W, w, dual=False):
+        '''
+            Call all subscribers which are due for this step.
+        '''
+        now = time()
+        for subscriber in self.subscribers:
+            if dual and not subscriber.dual:
+                continue
+            if not subscriber.due(self._count, now):
+                continue
+
+            if subscriber.threaded:
+                # w is overwritten by the next step so hand over a copy
+                self._put(subscriber.callback, (solver, problem, t, W,
+                                                self.copy(w), dual))
+            else:
+                subscriber.callback(solver, problem, t, W, w, dual)
+
+        self._count += 1
+
+    def flush(self):
+        '''
+            Wait for the threaded subscribers to finish and raise any error
+            they encountered.
+        '''
+        if self._queue is not None:
+            self._queue.join()
+
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _put(self, callback, args):
+
+        if self._queue is None:
+            self._queue = Queue()
+            worker = Thread(target=self._work)
+            worker.daemon = True
+            worker.start()
+
+        self._queue.put((callback, args))
+
+    def _work(self):
+
+        while True:
+            callback, args = self._queue.get()
+            try:
+                callback(*args)
+            except Exception as error:
+                self._error = error
+            finally:
+                self._queue.task_done()